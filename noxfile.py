@@ -186,7 +186,7 @@ def test(session):
         install_extras |= {"algo"}
         pytest_commands.extend(
             [
-                ["-p", "no:pytest-qt", "tests/unit"],
+                ["-p", "no:pytest-qt", "tests/unit", "--ignore=tests/unit/app"],
                 ["-p", "no:pytest-qt", "tests/processing"],
             ]
         )
@@ -221,6 +221,7 @@ def test(session):
         install_extras |= {"app"}
         pytest_commands.extend(
             [
+                ["-p", "no:pytest-qt", "tests/unit/app"],
                 ["--timeout=120", "--timeout_method=thread", "tests/gui"],
             ]
         )
@@ -0,0 +1 @@
+__version__ = "0.0.1.dev1+g7126b3a5e"
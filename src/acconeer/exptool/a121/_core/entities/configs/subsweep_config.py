@@ -33,6 +33,8 @@ SPARSE_IQ_PPC = 24
 
 
 def int_converter(value: int) -> int:
+    if type(value) is int:
+        return value
     return convert_value(value, factory=int)
 
 
@@ -96,16 +96,19 @@ class Aggregator:
 
     def process(self, extended_result: list[dict[int, a121.Result]]) -> AggregatorResult:
         processors_result = []
-        ampls: npt.NDArray[np.float_] = np.array([])
-        dists: npt.NDArray[np.float_] = np.array([])
+        ampls: list[float] = []
+        dists: list[float] = []
         for spec, processor in zip(self.specs, self.processors):
             processor_result = processor.process(extended_result[spec.group_index][spec.sensor_id])
             processors_result.append(processor_result)
             if processor_result.estimated_distances is not None:
-                ampls = np.concatenate((ampls, np.array(processor_result.estimated_amplitudes)))
-                dists = np.concatenate((dists, np.array(processor_result.estimated_distances)))
+                assert processor_result.estimated_amplitudes is not None
+                ampls.extend(processor_result.estimated_amplitudes)
+                dists.extend(processor_result.estimated_distances)
 
-        (dists_merged, ampls_merged) = self._merge_peaks(self.MIN_PEAK_DIST_M, dists, ampls)
+        (dists_merged, ampls_merged) = self._merge_peaks(
+            self.MIN_PEAK_DIST_M, np.array(dists, dtype=float), np.array(ampls, dtype=float)
+        )
         dists_sorted = self._sort_peaks(
             dists_merged, ampls_merged, self.config.peak_sorting_method
         )
@@ -149,4 +152,4 @@ class Aggregator:
             quantity_to_sort = -ampls * dists**2
         else:
             raise ValueError("Unknown peak sorting method")
-        return np.array([dists[i] for i in quantity_to_sort.argsort()])
+        return dists[quantity_to_sort.argsort()]
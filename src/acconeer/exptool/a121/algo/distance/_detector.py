@@ -918,11 +918,12 @@ class Detector:
 
     @classmethod
     def _m_to_points(cls, breakpoints_m: list[float], step_length: int) -> list[int]:
-        bpts_m = np.array(breakpoints_m)
+        bpts_m = np.asarray(breakpoints_m, dtype=float)
         start_point = int(bpts_m[0] / Processor.APPROX_BASE_STEP_LENGTH_M)
         num_steps = (bpts_m[-1] - bpts_m[0]) / (Processor.APPROX_BASE_STEP_LENGTH_M)
         bpts = num_steps / (bpts_m[-1] - bpts_m[0]) * (bpts_m - bpts_m[0]) + start_point
-        return [(bpt // step_length) * step_length for bpt in bpts]
+        bpts_on_step: list[int] = ((bpts // step_length).astype(int) * step_length).tolist()
+        return bpts_on_step
 
     @classmethod
     def _update_processor_mode(
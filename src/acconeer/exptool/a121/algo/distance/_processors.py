@@ -594,9 +594,8 @@ class Processor(ProcessorBase[ProcessorConfig, ProcessorResult]):
             take_relative_indexes = np.concatenate((-idx_cfar_pts, +idx_cfar_pts), axis=0)
             end_idx = abs_sweep.size - start_idx
 
-        for idx in np.arange(start_idx, end_idx):
-            take_indexes = idx + take_relative_indexes
-            threshold[idx] = np.mean(np.take(abs_sweep, take_indexes))
+        take_indexes = np.arange(start_idx, end_idx)[:, np.newaxis] + take_relative_indexes
+        threshold[start_idx:end_idx] = np.mean(np.take(abs_sweep, take_indexes), axis=1)
 
         threshold += abs_noise_std
         threshold *= num_stds
@@ -675,20 +674,20 @@ class Processor(ProcessorBase[ProcessorConfig, ProcessorResult]):
         step_length: int,
         step_length_m: float,
     ) -> Tuple[list[float], list[float]]:
-        estimated_distances = []
-        estimated_amplitudes = []
-        for peak_idx in peak_idxs:
-            # (https://math.stackexchange.com/questions/680646/get-polynomial-function-from-3-points)
-            x = np.arange(peak_idx - 1, peak_idx + 2, 1)
-            y = abs_sweep[peak_idx - 1 : peak_idx + 2]
-            a = (x[0] * (y[2] - y[1]) + x[1] * (y[0] - y[2]) + x[2] * (y[1] - y[0])) / (
-                (x[0] - x[1]) * (x[0] - x[2]) * (x[1] - x[2])
-            )
-            b = (y[1] - y[0]) / (x[1] - x[0]) - a * (x[0] + x[1])
-            c = y[0] - a * x[0] ** 2 - b * x[0]
-            peak_loc = -b / (2 * a)
-            estimated_distances.append((start_point + peak_loc * step_length) * step_length_m)
-            estimated_amplitudes.append(a * peak_loc**2 + b * peak_loc + c)
+        peak_idxs_arr = np.array(peak_idxs, dtype=int)
+        # (https://math.stackexchange.com/questions/680646/get-polynomial-function-from-3-points)
+        x = np.stack((peak_idxs_arr - 1, peak_idxs_arr, peak_idxs_arr + 1))
+        y = abs_sweep[x]
+        a = (x[0] * (y[2] - y[1]) + x[1] * (y[0] - y[2]) + x[2] * (y[1] - y[0])) / (
+            (x[0] - x[1]) * (x[0] - x[2]) * (x[1] - x[2])
+        )
+        b = (y[1] - y[0]) / (x[1] - x[0]) - a * (x[0] + x[1])
+        c = y[0] - a * x[0] ** 2 - b * x[0]
+        peak_loc = -b / (2 * a)
+        estimated_distances: list[float] = (
+            (start_point + peak_loc * step_length) * step_length_m
+        ).tolist()
+        estimated_amplitudes: list[float] = (a * peak_loc**2 + b * peak_loc + c).tolist()
         return estimated_distances, estimated_amplitudes
 
     @classmethod
@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 import logging
-import queue
 import shutil
 import time
 from pathlib import Path
@@ -13,7 +12,7 @@ from uuid import UUID
 
 from typing_extensions import Protocol
 
-from PySide6.QtCore import QDeadlineTimer, QObject, QThread, Signal
+from PySide6.QtCore import QObject, QThread, QTimer, Signal
 from PySide6.QtWidgets import QApplication, QWidget
 
 import pyqtgraph as pg
@@ -37,6 +36,7 @@ from acconeer.exptool.app.new.backend import (
     Message,
     PluginStateMessage,
     StatusMessage,
+    StopListening,
 )
 from acconeer.exptool.app.new.storage import get_config_dir, remove_temp_dir
 from acconeer.exptool.utils import USBDevice  # type: ignore[import]
@@ -83,13 +83,12 @@ class _BackendListeningThread(QThread):
     def run(self) -> None:
         log.debug("Backend listening thread starting...")
 
-        while not self.isInterruptionRequested():
-            try:
-                item = self.backend.recv(timeout=0.1)
-            except queue.Empty:
-                continue
+        while True:
+            item = self.backend.recv()
 
-            if isinstance(item, Message):
+            if isinstance(item, StopListening):
+                break
+            elif isinstance(item, Message):
                 self.sig_backend_message.emit(item)
             elif isinstance(item, ClosedTask):
                 self.sig_backend_closed_task.emit(item)
@@ -136,6 +135,8 @@ class AppModel(QObject):
 
         self._backend_task_callbacks: dict[UUID, Any] = {}
 
+        self._notify_pending = False
+
         self._a121_server_info: Optional[a121.ServerInfo] = None
 
         self.plugins = plugins
@@ -151,6 +152,7 @@ class AppModel(QObject):
         self.serial_connection_port = None
         self.usb_connection_device = None
         self.available_tagged_ports = []
+        self._available_serial_port_names: set[str] = set()
         self.available_usb_devices = []
         self.saveable_file = None
         self.autoconnect_enabled = False
@@ -182,16 +184,25 @@ class AppModel(QObject):
 
         remove_temp_dir()
 
-        self._listener.requestInterruption()
-        status = self._listener.wait(QDeadlineTimer(500))
-
-        if not status:
-            log.debug("Backend listening thread did not stop when requested, terminating...")
-            self._listener.terminate()
+        self._backend.interrupt_recv()
+        self._listener.wait()
 
         self._port_updater.stop()
 
     def broadcast(self) -> None:
+        """Schedules a ``sig_notify`` emission
+
+        Multiple calls within the same event loop iteration result in a single emission.
+        """
+
+        if self._notify_pending:
+            return
+
+        self._notify_pending = True
+        QTimer.singleShot(0, self._flush_notify)
+
+    def _flush_notify(self) -> None:
+        self._notify_pending = False
         self.sig_notify.emit(self)
 
     def emit_error(self, exception: Exception, traceback_format_exc: Optional[str] = None) -> None:
@@ -327,11 +338,13 @@ class AppModel(QObject):
         tagged_ports: list[Tuple[str, Optional[str]]],
         usb_devices: Optional[list[USBDevice]],
     ) -> None:
-        tagged_ports_map = dict(tagged_ports)
+        previous_port_state = self._get_port_state()
+
+        port_names = {port for port, _ in tagged_ports}
         if self.connection_state is not ConnectionState.DISCONNECTED and (
             (
                 self.connection_interface == ConnectionInterface.SERIAL
-                and self.serial_connection_port not in tagged_ports_map.keys()
+                and self.serial_connection_port not in port_names
             )
             or (
                 self.connection_interface == ConnectionInterface.USB
@@ -341,12 +354,14 @@ class AppModel(QObject):
         ):
             self.disconnect_client()
         self.serial_connection_port, recognized = self._select_new_serial_port(
-            dict(self.available_tagged_ports),
-            tagged_ports_map,
+            self._available_serial_port_names,
+            tagged_ports,
+            port_names,
             self.serial_connection_port,
         )
 
         self.available_tagged_ports = tagged_ports
+        self._available_serial_port_names = port_names
         connect = False
 
         if recognized:
@@ -370,37 +385,46 @@ class AppModel(QObject):
         if connect and self.autoconnect_enabled:
             self._autoconnect()
 
-        self.broadcast()
+        if self._get_port_state() != previous_port_state:
+            self.broadcast()
+
+    def _get_port_state(self) -> Tuple[Any, ...]:
+        return (
+            self.serial_connection_port,
+            self.available_tagged_ports,
+            self.usb_connection_device,
+            self.available_usb_devices,
+        )
 
     def _autoconnect(self) -> None:
         self.connect_client(auto=True)
 
     def _select_new_serial_port(
         self,
-        old_ports: dict[str, Optional[str]],
-        new_ports: dict[str, Optional[str]],
+        old_port_names: set[str],
+        new_ports: list[Tuple[str, Optional[str]]],
+        new_port_names: set[str],
         current_port: Optional[str],
     ) -> Tuple[Optional[str], bool]:
         if self.connection_state != ConnectionState.DISCONNECTED:
             return current_port, False
 
-        if current_port not in new_ports:  # Then find a new suitable port
+        if current_port not in new_port_names:  # Then find a new suitable port
             port = None
 
-            for port, tag in new_ports.items():
+            for port, tag in new_ports:
                 if tag:
                     return port, (current_port is None)
 
             return port, False
 
         # If we already have a tagged port, keep it
-        if new_ports[current_port]:
+        if next(tag for port, tag in new_ports if port == current_port):
             return current_port, False
 
         # If a tagged port was added, select it
-        added_ports = {k: v for k, v in new_ports.items() if k not in old_ports}
-        for port, tag in added_ports.items():
-            if tag:
+        for port, tag in new_ports:
+            if tag and port not in old_port_names:
                 return port, True
 
         return current_port, False
@@ -472,14 +496,23 @@ class AppModel(QObject):
         self.send_status_message('<p style="color: #FD5200;"><b>Failed to autoconnect</b></p>')
 
     def set_connection_interface(self, connection_interface: ConnectionInterface) -> None:
+        if connection_interface == self.connection_interface:
+            return
+
         self.connection_interface = connection_interface
         self.broadcast()
 
     def set_socket_connection_ip(self, ip: str) -> None:
+        if ip == self.socket_connection_ip:
+            return
+
         self.socket_connection_ip = ip
         self.broadcast()
 
     def set_serial_connection_port(self, port: Optional[str]) -> None:
+        if port == self.serial_connection_port:
+            return
+
         self.serial_connection_port = port
         self.broadcast()
 
@@ -488,6 +521,9 @@ class AppModel(QObject):
         self.broadcast()
 
     def set_plugin_state(self, state: PluginState) -> None:
+        if state == self.plugin_state:
+            return
+
         self.plugin_state = state
         self.broadcast()
 
@@ -1,7 +1,7 @@
 # Copyright (c) Acconeer AB, 2022
 # All rights reserved
 
-from ._backend import Backend, ClosedTask
+from ._backend import Backend, ClosedTask, StopListening
 from ._backend_plugin import BackendPlugin
 from ._message import (
     BackendPluginStateMessage,
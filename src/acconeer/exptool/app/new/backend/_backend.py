@@ -27,6 +27,10 @@ class ClosedTask:
     traceback_format_exc: Optional[str] = attrs.field(default=None)
 
 
+class StopListening:
+    """Put on the receive queue by ``Backend.interrupt_recv``, never sent by the backend process"""
+
+
 TaskName = str
 TaskPlugin = bool
 TaskKwargs = Dict[str, Any]
@@ -37,11 +41,12 @@ ToBackendQueueItem = Union[
     Tuple[Literal["task"], Tuple[uuid.UUID, Task]],
 ]
 FromBackendQueueItem = Union[Message, ClosedTask]
+RecvQueueItem = Union[FromBackendQueueItem, StopListening]
 
 
 class Backend:
     def __init__(self):
-        self._recv_queue: mp.Queue[FromBackendQueueItem] = mp.Queue()
+        self._recv_queue: mp.Queue[RecvQueueItem] = mp.Queue()
         self._send_queue: mp.Queue[ToBackendQueueItem] = mp.Queue()
         self._stop_event = mp.Event()
         self._process = mp.Process(
@@ -84,9 +89,13 @@ class Backend:
     def _send(self, item: ToBackendQueueItem) -> None:
         self._send_queue.put(item)
 
-    def recv(self, timeout: Optional[float] = None) -> FromBackendQueueItem:
+    def recv(self, timeout: Optional[float] = None) -> RecvQueueItem:
         return self._recv_queue.get(timeout=timeout)
 
+    def interrupt_recv(self) -> None:
+        """Makes a (blocking) call to ``recv`` return a ``StopListening`` instance"""
+        self._recv_queue.put(StopListening())
+
 
 def process_program(
     recv_queue: mp.Queue[ToBackendQueueItem],
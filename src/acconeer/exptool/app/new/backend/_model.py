@@ -27,6 +27,16 @@ def is_task(func: T) -> T:
     return func
 
 
+def _get_tasks(obj: Any) -> dict[str, Callable[..., None]]:
+    """Maps the names of all methods of ``obj`` decorated with ``is_task`` to the bound methods"""
+    cls = type(obj)
+    return {
+        name: getattr(obj, name)
+        for name in dir(cls)
+        if getattr(getattr(cls, name, None), "is_task", False)
+    }
+
+
 class Model:
     backend_plugin: Optional[BackendPlugin]
     client: Optional[a121.Client]
@@ -35,6 +45,8 @@ class Model:
         self.backend_plugin = None
         self.client = None
         self.task_callback = task_callback
+        self._tasks = _get_tasks(self)
+        self._backend_plugin_tasks: dict[str, Callable[..., None]] = {}
 
     def idle(self) -> bool:
         if self.backend_plugin is None:
@@ -47,15 +59,13 @@ class Model:
             if self.backend_plugin is None:
                 raise RuntimeError
 
-            obj: Any = self.backend_plugin
+            tasks = self._backend_plugin_tasks
         else:
-            obj = self
+            tasks = self._tasks
 
         try:
-            method = getattr(obj, name)
-            if not getattr(method, "is_task"):
-                raise Exception
-        except Exception:
+            method = tasks[name]
+        except KeyError:
             raise RuntimeError(f"'{name}' is not a task")
 
         method(**kwargs)
@@ -120,6 +130,7 @@ class Model:
             self.unload_plugin(send_callback=False)
 
         self.backend_plugin = plugin(callback=self.task_callback, key=key)
+        self._backend_plugin_tasks = _get_tasks(self.backend_plugin)
         log.info(f"{plugin.__name__} was loaded.")
 
         if self.client is not None and self.client.connected:
@@ -135,6 +146,7 @@ class Model:
 
         self.backend_plugin.teardown()
         self.backend_plugin = None
+        self._backend_plugin_tasks = {}
         log.debug("Current BackendPlugin was torn down")
 
         if send_callback:
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import logging
 import queue
+import struct
 from typing import List
 
 import serial
@@ -15,6 +16,8 @@ from acconeer.exptool.flash._xc120._uart_protocol import Packet, UartReader
 
 _LOG = logging.getLogger(__name__)
 
+_UINT16_LE = struct.Struct("<H")
+
 
 class CommandFailed(Exception):
     pass
@@ -24,20 +27,29 @@ class BlCommandResponsePacket(Packet):
     packet_type = 0xF3
 
     def __init__(self, payload):
-        self.command_id = int.from_bytes(payload[0:2], byteorder="little")
-        self.command_payload = payload[2:]
+        if len(payload) < _UINT16_LE.size:
+            raise ValueError(f"Command response payload too short ({len(payload)} bytes)")
+        (self.command_id,) = _UINT16_LE.unpack_from(payload)
+        self.command_payload = memoryview(payload)[2:]
         super().__init__(payload)
 
     def get_command_packet(self):
-        return _command_packets.get(self.command_id)(self.command_payload)
+        packet_class = _command_packets.get(self.command_id)
+        if packet_class is None:
+            raise CommandFailed(f"Unknown response command id 0x{self.command_id:04X}")
+        return packet_class(self.command_payload)
 
 
 class BlCommandRequestPacket(Packet):
     packet_type = 0xF3
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, "command_id"):
+            cls._command_id_prefix = cls.command_id.to_bytes(2, byteorder="little")
+
     def __init__(self, command_payload):
-        command_payload[0:0] = self.command_id.to_bytes(2, byteorder="little")
-        super().__init__(command_payload)
+        super().__init__(self._command_id_prefix + command_payload)
 
 
 class GetLastErrorRequestPacket(BlCommandRequestPacket):
@@ -60,7 +72,7 @@ class GetLastErrorResponsePacket:
         return self.payload[0]
 
     def get_response_data(self):
-        return self.payload[1:].decode("ascii")
+        return bytes(self.payload[1:]).decode("ascii")
 
 
 class GetAppSwVersionRequestPacket(BlCommandRequestPacket):
@@ -83,7 +95,7 @@ class GetAppSwVersionResponsePacket:
         return self.payload[0]
 
     def get_version(self):
-        return self.payload[1:].decode("ascii")
+        return bytes(self.payload[1:]).decode("ascii")
 
 
 class GetAppSwNameRequestPacket(BlCommandRequestPacket):
@@ -106,7 +118,7 @@ class GetAppSwNameResponsePacket:
         return self.payload[0]
 
     def get_name(self):
-        return self.payload[1:].decode("ascii")
+        return bytes(self.payload[1:]).decode("ascii")
 
 
 class IsImageErasedRequestPacket(BlCommandRequestPacket):
@@ -178,7 +178,11 @@ class UartReader(threading.Thread):
                     payload[:10],
                     end_marker,
                 )
-                packet = self._packet_types[packet_type](payload)
+                try:
+                    packet = self._packet_types[packet_type](payload)
+                except ValueError as exception:
+                    _LOG.error("Dropping malformed packet: %s", exception)
+                    continue
                 self._packets[packet_type].put(packet)
         except Exception as exception:
             _LOG.error("UartReader: Got exception %s", exception)
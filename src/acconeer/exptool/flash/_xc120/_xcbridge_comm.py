@@ -5,6 +5,7 @@
 
 import logging
 import queue
+import struct
 
 import serial
 
@@ -13,6 +14,8 @@ from acconeer.exptool.flash._xc120._uart_protocol import Packet, UartReader
 
 _LOG = logging.getLogger(__name__)
 
+_UINT16_LE = struct.Struct("<H")
+
 
 class CommandFailed(Exception):
     pass
@@ -22,20 +25,32 @@ class XcCommandResponsePacket(Packet):
     packet_type = 0xF2
 
     def __init__(self, payload):
-        self.command_id = int.from_bytes(payload[0:2], byteorder="little")
-        self.command_payload = payload[2:]
+        if len(payload) < _UINT16_LE.size:
+            raise ValueError(f"Command response payload too short ({len(payload)} bytes)")
+        (self.command_id,) = _UINT16_LE.unpack_from(payload)
+        self.command_payload = memoryview(payload)[2:]
         super().__init__(payload)
 
     def get_command_packet(self):
-        return _command_packets.get(self.command_id)(self.command_payload)
+        if self.command_id < _COMMAND_PACKET_TABLE_SIZE:
+            packet_class = _command_packet_table[self.command_id]
+        else:
+            packet_class = _command_packets.get(self.command_id)
+        if packet_class is None:
+            raise CommandFailed(f"Unknown response command id 0x{self.command_id:04X}")
+        return packet_class(self.command_payload)
 
 
 class XcCommandRequestPacket(Packet):
     packet_type = 0xF2
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, "command_id"):
+            cls._command_id_prefix = cls.command_id.to_bytes(2, byteorder="little")
+
     def __init__(self, command_payload):
-        command_payload[0:0] = self.command_id.to_bytes(2, byteorder="little")
-        super().__init__(command_payload)
+        super().__init__(self._command_id_prefix + command_payload)
 
 
 class GetLastErrorRequestPacket(XcCommandRequestPacket):
@@ -58,7 +73,7 @@ class GetLastErrorResponsePacket:
         return self.payload[0]
 
     def get_response_data(self):
-        return self.payload[1:].decode("ascii")
+        return bytes(self.payload[1:]).decode("ascii")
 
 
 class GetAppSwVersionRequestPacket(XcCommandRequestPacket):
@@ -81,7 +96,7 @@ class GetAppSwVersionResponsePacket:
         return self.payload[0]
 
     def get_version(self):
-        return self.payload[1:].decode("ascii")
+        return bytes(self.payload[1:]).decode("ascii")
 
 
 class GetAppSwNameRequestPacket(XcCommandRequestPacket):
@@ -104,7 +119,7 @@ class GetAppSwNameResponsePacket:
         return self.payload[0]
 
     def get_name(self):
-        return self.payload[1:].decode("ascii")
+        return bytes(self.payload[1:]).decode("ascii")
 
 
 class DfuRebootRequestPacket(XcCommandRequestPacket):
@@ -124,6 +139,22 @@ _command_packets = {
 }
 
 
+# Command ids below this are looked up in a dense table, higher ones in _command_packets
+_COMMAND_PACKET_TABLE_SIZE = 0x200
+
+
+def _build_command_packet_table():
+    """Builds the command id indexed lookup table for the low ids in _command_packets"""
+    table = [None] * _COMMAND_PACKET_TABLE_SIZE
+    for command_id, packet_class in _command_packets.items():
+        if command_id < _COMMAND_PACKET_TABLE_SIZE:
+            table[command_id] = packet_class
+    return tuple(table)
+
+
+_command_packet_table = _build_command_packet_table()
+
+
 class XCCommunication:
     def __init__(self, port):
         self._ser = serial.Serial(port, exclusive=True)
@@ -1,6 +1,8 @@
 # Copyright (c) Acconeer AB, 2022
 # All rights reserved
 
+import pytest
+
 from acconeer.exptool import a121
 from acconeer.exptool.a121.algo import distance
 
@@ -45,6 +47,21 @@ def test_m_to_points():
     assert actual_points[2] == 600
 
 
+@pytest.mark.parametrize(
+    ("step_length", "expected_points"),
+    [
+        (1, [40, 3759]),
+        (4, [40, 3756]),
+    ],
+)
+def test_m_to_points_rounding(step_length, expected_points):
+    actual_points = distance.Detector._m_to_points(
+        breakpoints_m=[0.1, 9.4], step_length=step_length
+    )
+
+    assert actual_points == expected_points
+
+
 def test_select_prf():
     breakpoint = 600
     profile = a121.Profile.PROFILE_3
@@ -11,63 +11,53 @@ import pytest
 from acconeer.exptool import a121
 
 
-def test_sweeps_per_frame():
-    # Default value
-
+def test_sweeps_per_frame_default():
     config = a121.SensorConfig()
     assert config.sweeps_per_frame == 1
 
-    # Conversion
+    assert a121.SensorConfig.sweeps_per_frame.__doc__
 
-    config.sweeps_per_frame = 2
-    assert config.sweeps_per_frame == 2
-    assert isinstance(config.sweeps_per_frame, int)
 
-    config.sweeps_per_frame = 3.0
-    assert config.sweeps_per_frame == 3
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (2, 2),
+        (3.0, 3),
+    ],
+)
+def test_sweeps_per_frame_coerce(value, expected):
+    config = a121.SensorConfig()
+    config.sweeps_per_frame = value
+    assert config.sweeps_per_frame == expected
     assert isinstance(config.sweeps_per_frame, int)
 
-    with pytest.raises(TypeError):
-        config.sweeps_per_frame = "not-an-int"
-
-    with pytest.raises(TypeError):
-        config.sweeps_per_frame = "3"
-
-    with pytest.raises(TypeError):
-        config.sweeps_per_frame = 3.5
-
-    config = a121.SensorConfig(sweeps_per_frame=2)
-    assert config.sweeps_per_frame == 2
+    config = a121.SensorConfig(sweeps_per_frame=value)
+    assert config.sweeps_per_frame == expected
     assert isinstance(config.sweeps_per_frame, int)
 
-    config = a121.SensorConfig(sweeps_per_frame=3.0)
-    assert config.sweeps_per_frame == 3
-    assert isinstance(config.sweeps_per_frame, int)
 
-    with pytest.raises(TypeError):
-        a121.SensorConfig(sweeps_per_frame="not-an-int")
+@pytest.mark.parametrize("value", ["not-an-int", "3", 3.5])
+def test_sweeps_per_frame_type_error(value):
+    config = a121.SensorConfig()
 
     with pytest.raises(TypeError):
-        a121.SensorConfig(sweeps_per_frame="3")
+        config.sweeps_per_frame = value
 
     with pytest.raises(TypeError):
-        a121.SensorConfig(sweeps_per_frame=3.5)
+        a121.SensorConfig(sweeps_per_frame=value)
 
-    # Validation
 
+@pytest.mark.parametrize("value", [0])
+def test_sweeps_per_frame_value_error(value):
     config = a121.SensorConfig()
 
     with pytest.raises(ValueError):
-        config.sweeps_per_frame = 0
+        config.sweeps_per_frame = value
 
     assert config.sweeps_per_frame == 1
 
     with pytest.raises(ValueError):
-        a121.SensorConfig(sweeps_per_frame=0)
-
-    # Documentation
-
-    assert a121.SensorConfig.sweeps_per_frame.__doc__
+        a121.SensorConfig(sweeps_per_frame=value)
 
 
 def test_subsweep_properties_read_only():
@@ -0,0 +1,74 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+import pytest
+
+from acconeer.exptool.app.new.backend import BackendPlugin, is_task
+from acconeer.exptool.app.new.backend._model import Model
+
+
+class StubBackendPlugin(BackendPlugin):
+    def __init__(self, callback, key):
+        super().__init__(callback=callback, key=key)
+        self.calls = []
+
+    def idle(self):
+        return True
+
+    def attach_client(self, *, client):
+        pass
+
+    def detach_client(self):
+        pass
+
+    def teardown(self):
+        pass
+
+    @is_task
+    def foo(self, *, value):
+        self.calls.append(value)
+
+    def bar(self):
+        self.calls.append("bar")
+
+
+@pytest.fixture
+def model():
+    return Model(task_callback=lambda message: None)
+
+
+def test_execute_task(model):
+    model.execute_task("load_plugin", {"plugin": StubBackendPlugin, "key": "stub"}, plugin=False)
+
+    assert isinstance(model.backend_plugin, StubBackendPlugin)
+
+
+def test_execute_task_not_a_task(model):
+    with pytest.raises(RuntimeError):
+        model.execute_task("idle", {}, plugin=False)
+
+    with pytest.raises(RuntimeError):
+        model.execute_task("no_such_method", {}, plugin=False)
+
+
+def test_execute_plugin_task(model):
+    with pytest.raises(RuntimeError):
+        model.execute_task("foo", {"value": 1}, plugin=True)
+
+    model.load_plugin(plugin=StubBackendPlugin, key="stub")
+    backend_plugin = model.backend_plugin
+    model.execute_task("foo", {"value": 1}, plugin=True)
+
+    assert backend_plugin.calls == [1]
+
+    with pytest.raises(RuntimeError):
+        model.execute_task("bar", {}, plugin=True)
+
+    assert backend_plugin.calls == [1]
+
+    model.unload_plugin()
+
+    with pytest.raises(RuntimeError):
+        model.execute_task("foo", {"value": 2}, plugin=True)
+
+    assert backend_plugin.calls == [1]